@@ -101,21 +101,29 @@ const renderTemplates = async (name, vars, procs, templates) => {
   await rimraf(TMPL_DIR);
   await mkdirp(TMPL_DIR);
 
+  const projectName = `taskcluster-${name}`;
+  const configName = name.replace(/-/g, '_');
+
+  const secrets = [];
+  for (const v of vars) {
+    const val = v.toLowerCase();
+    if (!NON_CONFIGURABLE.includes(val)) {
+      secrets.push({
+        key: v,
+        val: SHARED_CONFIG[val] || `.Values.${configName}.${val}`,
+      });
+    }
+  }
+
+  // the same context is used for all of the per-service resources, so build it once
+  const serviceContext = {
+    projectName,
+    labels: labels(projectName, 'secrets'),
+    secrets,
+  };
+
   for (const resource of ['role', 'rolebinding', 'serviceaccount', 'secret']) {
-    const rendered = jsone(templates[resource], {
-      projectName: `taskcluster-${name}`,
-      labels: labels(`taskcluster-${name}`, 'secrets'),
-      secrets: vars.map(v => {
-        const val = v.toLowerCase();
-        if (NON_CONFIGURABLE.includes(val)) {
-          return null;
-        }
-        return {
-          key: v,
-          val: SHARED_CONFIG[val] || `.Values.${name.replace(/-/g, '_')}.${val}`,
-        };
-      }).filter(x => x !== null),
-    });
+    const rendered = jsone(templates[resource], serviceContext);
     const file = `taskcluster-${name}-${resource}.yaml`;
     await writeRepoYAML(path.join(TMPL_DIR, file), rendered);
   }
@@ -124,14 +132,14 @@ const renderTemplates = async (name, vars, procs, templates) => {
   for (const [proc, conf] of Object.entries(procs)) {
     let tmpl;
     const context = {
-      projectName: `taskcluster-${name}`,
+      projectName,
       serviceName: name,
-      configName: name.replace(/-/g, '_'),
+      configName,
       configProcName: proc.replace(/-/g, '_'),
       procName: proc,
       needsService: false,
       readinessPath: conf.readinessPath || `/api/${name}/v1/ping`,
-      labels: labels(`taskcluster-${name}`, proc),
+      labels: labels(projectName, proc),
     };
     switch (conf['type']) {
       case 'web': {
@@ -140,7 +148,7 @@ const renderTemplates = async (name, vars, procs, templates) => {
         const rendered = jsone(templates['service'], context);
         const file = `taskcluster-${name}-service-${proc}.yaml`;
         ingresses.push({
-          projectName: `taskcluster-${name}`,
+          projectName,
           paths: conf['paths'] || [`/api/${name}/*`], // TODO: This version of config is only for gcp ingress :(
         });
         await writeRepoYAML(path.join(TMPL_DIR, file), rendered);